@@ -1,23 +1,184 @@
 import requests
 import logging
+import threading
+import queue
+import random
+import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from typing import Dict, List, Optional, Any, Generator
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Dict, List, Optional, Any, Generator, Tuple
 import json
 from loki_logger import get_logger, log_api_call
 
+try:
+    # Optional fast JSON parser; multi-KB deal pages parse several times
+    # faster through orjson's C implementation than through stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional incremental JSON parser used by get_all_deals_streaming to
+    # yield deals while the page is still downloading
+    import ijson
+except ImportError:
+    ijson = None
+
+# Per-sleep tracing in the rate limiter; the log can fire up to 150 times
+# per 10s window, so it stays off unless actively debugging pacing
+_RATE_LIMIT_TRACE = False
+
+
+class MemoryTokenBucket:
+    """
+    In-process token bucket rate limiter (default strategy)
+
+    HubSpot allows the full allowance as a burst within any window, so
+    short runs proceed at wire speed and only sustained load above the
+    refill rate has to sleep. The lock keeps the bucket consistent when
+    concurrent callers (page prefetch workers, parallel scans) share one
+    service instance. Accurate for a single process only — sharded
+    deployments should use RedisSlidingWindow instead.
+    """
+
+    def __init__(self, limit: int = 150, period: float = 10, logger=None):
+        self.limit = limit
+        self.period = period
+        self.refill_rate = limit / period  # tokens/second
+        self.tokens = float(limit)
+        self.last_refill = time.monotonic()
+        self.logger = logger or get_logger(__name__)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token from the bucket, sleeping only when it is empty"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    float(self.limit),
+                    self.tokens + (now - self.last_refill) * self.refill_rate
+                )
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                sleep_time = (1 - self.tokens) / self.refill_rate
+
+            if _RATE_LIMIT_TRACE and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Rate limiting: sleeping for %.3f seconds", sleep_time,
+                    extra={'operation': 'rate_limit_wait', 'sleep_time': sleep_time}
+                )
+            time.sleep(sleep_time)
+
+
+class RedisSlidingWindow:
+    """
+    Sliding-window rate limiter backed by a shared Redis sorted set
+
+    HubSpot's 150/10s limit applies account-wide; when the ETL is sharded
+    across processes or containers, per-process buckets each assume the
+    full budget and collectively thrash on 429s. A timestamp sorted set in
+    Redis enforces the true window across all workers.
+
+    The client is duck-typed against the redis-py pipeline API
+    (zremrangebyscore/zcard/zadd/expire/zrange), so this module carries no
+    redis dependency — callers construct the client and inject it.
+    """
+
+    def __init__(self, redis_client, key: str = 'hubspot:rl',
+                 window: float = 10, limit: int = 150):
+        self.redis = redis_client
+        self.key = key
+        self.window = window
+        self.limit = limit
+
+    def acquire(self):
+        """Claim one slot in the global window, sleeping while it is full
+
+        The reservation is optimistic: the member is added in the same
+        atomic pipeline as the trim and count, so every worker sees a
+        count that already includes its own entry and concurrent callers
+        cannot all admit themselves past the limit — losers remove their
+        member and wait.
+        """
+        while True:
+            now = time.time()
+            member = f"{now:.6f}:{os.urandom(4).hex()}"
+            pipe = self.redis.pipeline()
+            pipe.zremrangebyscore(self.key, 0, now - self.window)
+            pipe.zadd(self.key, {member: now})
+            pipe.zcard(self.key)
+            pipe.expire(self.key, int(self.window) + 1)
+            count = pipe.execute()[2]
+
+            if count <= self.limit:
+                return
+
+            # Over the limit including our own reservation: withdraw it
+            # and sleep until the oldest entry ages out
+            self.redis.zrem(self.key, member)
+            oldest = self.redis.zrange(self.key, 0, 0, withscores=True)
+            if oldest:
+                sleep_time = max(oldest[0][1] + self.window - now, 0.01)
+            else:
+                sleep_time = self.window / self.limit
+            time.sleep(sleep_time)
+
 
 class HubSpotAPIService:
     """
     Service for interacting with HubSpot CRM API v3 for deals extraction
     """
-    
-    def __init__(self, access_token: str, base_url: str = "https://api.hubapi.com"):
+
+    # Default properties for deals, with the CSV form precomputed once at
+    # class definition: get_deals runs per page, so the join must not
+    # re-execute on every call
+    _DEFAULT_PROPERTIES: ClassVar[Tuple[str, ...]] = (
+        'dealname', 'amount', 'dealstage', 'closedate', 'pipeline',
+        'dealtype', 'hubspot_owner_id', 'description', 'createdate',
+        'hs_lastmodifieddate', 'hs_deal_stage_probability'
+    )
+    _DEFAULT_PROPERTIES_CSV: ClassVar[str] = ','.join(_DEFAULT_PROPERTIES)
+
+    def __init__(self, access_token: str, base_url: str = "https://api.hubapi.com",
+                 rate_limiter=None):
         self.base_url = base_url.rstrip('/')
+        # Hot endpoint URLs, formatted once instead of per page fetch
+        self._deals_url = f"{self.base_url}/crm/v3/objects/deals"
+        self._deals_search_url = f"{self.base_url}/crm/v3/objects/deals/search"
         self.access_token = access_token
         self.logger = get_logger(__name__)
         self.session = requests.Session()
-        
+        # Bearer-auth'd API with static endpoints: skip the per-request
+        # environment lookup for proxies/netrc that trust_env triggers
+        self.session.trust_env = False
+
+        # Default adapters keep only 10 pooled connections; size the pool for
+        # concurrent callers (page prefetch, parallel scans) so they reuse
+        # keep-alive connections instead of paying TLS setup per request.
+        # Transient failures on GETs retry inside urllib3 with backoff and
+        # Retry-After support, keeping the connection instead of unwinding
+        # back through the Python stack; POSTs are excluded since search is
+        # not guaranteed idempotent
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry, pool_connections=32, pool_maxsize=64
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Set default headers
         self.session.headers.update({
             'Authorization': f'Bearer {access_token}',
@@ -26,11 +187,32 @@ class HubSpotAPIService:
             'User-Agent': 'HubSpot-Deals-ETL-Service/1.0'
         })
         
-        # Rate limiting configuration (150 requests per 10 seconds)
+        # Rate limiting configuration (150 requests per 10 seconds). The
+        # in-process token bucket is the default; sharded deployments can
+        # inject a RedisSlidingWindow so all workers share one budget
         self.rate_limit = 150
         self.rate_period = 10  # seconds
-        self.request_interval = self.rate_period / self.rate_limit  # ~0.067 seconds
-        self.last_request_time = 0
+        self.rate_limiter = rate_limiter or MemoryTokenBucket(
+            self.rate_limit, self.rate_period, logger=self.logger
+        )
+
+        # The search endpoint has its own, much lower per-token limit
+        # (~4 requests/second); pace it separately so sustained filtered
+        # runs don't sit in the POST 429 sleep loop
+        self._search_limiter = MemoryTokenBucket(4, 1, logger=self.logger)
+
+        # ETag revalidation cache for slow-changing metadata endpoints
+        # (properties, pipelines): url -> (etag, parsed JSON)
+        self._etag_cache: Dict[str, tuple] = {}
+
+        # Per-instance PRNG for backoff jitter; instance-local to avoid
+        # contending on the random module's shared state across threads
+        self._rng = random.Random()
+
+        # Monotonic deadline until which the last successful credential
+        # validation is trusted, so composite workflows (test_connection
+        # followed by extraction) don't pay two identical probe calls
+        self._creds_valid_until: float = 0.0
         
         self.logger.debug(
             "HubSpot API service initialized",
@@ -43,19 +225,8 @@ class HubSpotAPIService:
         )
     
     def _wait_for_rate_limit(self):
-        """Ensure we don't exceed rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.request_interval:
-            sleep_time = self.request_interval - time_since_last
-            self.logger.debug(
-                f"Rate limiting: sleeping for {sleep_time:.3f} seconds",
-                extra={'operation': 'rate_limit_wait', 'sleep_time': sleep_time}
-            )
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Block until the configured rate-limiter strategy grants a slot"""
+        self.rate_limiter.acquire()
     
     def _handle_rate_limit_response(self, response: requests.Response) -> bool:
         """Handle 429 rate limit responses with exponential backoff"""
@@ -69,75 +240,129 @@ class HubSpotAPIService:
                     'status_code': 429
                 }
             )
-            time.sleep(retry_after)
+            # Spread synchronized retries: every worker that got this 429
+            # sees the same Retry-After, so a fixed sleep would send them
+            # all back at the same instant. Jitter past the server's
+            # minimum (full-jitter style, never below the hint)
+            time.sleep(retry_after + self._rng.random())
             return True
         return False
     
     def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make HTTP request with rate limiting and retry logic"""
+        """Make HTTP request with rate limiting
+
+        Transient failures and retryable status codes on GETs are retried
+        inside urllib3 by the Retry policy mounted on the session adapter,
+        so this method only paces requests against the rate limit and
+        honors Retry-After for the non-GET calls the adapter won't retry.
+
+        The request is prepared once and dispatched via session.send,
+        bypassing the cookie merging, redirect resolution and hook
+        dispatch that session.request runs per call — none of which this
+        bearer-auth'd, redirect-free API needs.
+        """
         max_retries = 3
-        
+        stream = kwargs.pop('stream', False)
+        timeout = kwargs.pop('timeout', 30)
+        prepared = self.session.prepare_request(
+            requests.Request(method, url, **kwargs)
+        )
+
         for attempt in range(max_retries):
             self._wait_for_rate_limit()
-            
-            try:
-                response = self.session.request(method, url, **kwargs)
-                
-                # Handle rate limiting
-                if self._handle_rate_limit_response(response):
-                    continue  # Retry after rate limit wait
-                
-                # Handle other errors
-                if response.status_code >= 400:
-                    self.logger.warning(
-                        f"HTTP {response.status_code} error",
-                        extra={
-                            'operation': 'http_request',
-                            'method': method,
-                            'url': url,
-                            'status_code': response.status_code,
-                            'attempt': attempt + 1
-                        }
-                    )
-                
-                response.raise_for_status()
+
+            response = self.session.send(
+                prepared, stream=stream, timeout=timeout, allow_redirects=False
+            )
+
+            # The adapter retry policy only covers GETs; handle 429 pacing
+            # for POST endpoints (search, batch read) here
+            if self._handle_rate_limit_response(response):
+                continue
+
+            # Success fast path: skip raise_for_status bookkeeping on 2xx
+            if response.ok:
                 return response
-                
-            except requests.exceptions.RequestException as e:
-                if attempt == max_retries - 1:
-                    raise
-                
-                wait_time = (2 ** attempt) + (time.time() % 1)  # Exponential backoff with jitter
-                self.logger.warning(
-                    f"Request failed, retrying in {wait_time:.2f}s",
-                    extra={
-                        'operation': 'request_retry',
-                        'attempt': attempt + 1,
-                        'error': str(e),
-                        'wait_time': wait_time
-                    }
-                )
-                time.sleep(wait_time)
-        
+
+            # Token no longer accepted; drop the validation memo so the
+            # next validate_credentials call probes again
+            if response.status_code == 401:
+                self._creds_valid_until = 0.0
+
+            self.logger.warning(
+                f"HTTP {response.status_code} error",
+                extra={
+                    'operation': 'http_request',
+                    'method': method,
+                    'url': url,
+                    'status_code': response.status_code,
+                    'attempt': attempt + 1
+                }
+            )
+            response.raise_for_status()
+            return response
+
         raise Exception(f"Max retries ({max_retries}) exceeded")
-    
+
+    def _json(self, response: requests.Response) -> Any:
+        """Parse a JSON response body, preferring orjson when installed"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _cached_get(self, url: str) -> Dict[str, Any]:
+        """
+        GET slow-changing metadata with ETag revalidation
+
+        Sends If-None-Match when a cached copy exists; on 304 Not Modified
+        the body transfer and JSON parse are skipped and the cached payload
+        is returned.
+        """
+        cached = self._etag_cache.get(url)
+        headers = {'If-None-Match': cached[0]} if cached else None
+
+        response = self._make_request('GET', url, headers=headers)
+
+        if response.status_code == 304 and cached:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Metadata served from ETag cache",
+                    extra={'operation': 'cached_get', 'url': url}
+                )
+            return cached[1]
+
+        result = self._json(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[url] = (etag, result)
+
+        return result
+
     def validate_credentials(self) -> bool:
         """
         Validate HubSpot API access token by making a test request
+
+        A successful probe is remembered for 60 seconds so back-to-back
+        callers (test_connection, then the extraction itself) share one
+        round-trip; any 401 seen by _make_request drops the memo.
         """
+        if time.monotonic() < self._creds_valid_until:
+            return True
+
         try:
             self.logger.debug(
                 "Validating HubSpot access token",
                 extra={'operation': 'validate_credentials'}
             )
             
-            url = f"{self.base_url}/crm/v3/objects/deals"
+            url = self._deals_url
             params = {'limit': 1}
             
             response = self._make_request('GET', url, params=params)
             is_valid = response.status_code == 200
             
             if is_valid:
+                self._creds_valid_until = time.monotonic() + 60
                 self.logger.info(
                     "HubSpot credentials validation successful",
                     extra={'operation': 'validate_credentials'}
@@ -180,51 +405,55 @@ class HubSpotAPIService:
         Returns:
             Dict containing deals data and pagination info
         """
-        start_time = datetime.utcnow()
-        
+        params = self._build_deals_params(limit, properties, archived, **filters)
+        if after:
+            params['after'] = after
+        return self._get_deals_page(params)
+
+    def _build_deals_params(self,
+                            limit: int,
+                            properties: Optional[List[str]],
+                            archived: bool,
+                            **filters) -> Dict[str, Any]:
+        """
+        Build the query parameters for the deals list endpoint
+
+        Split out of get_deals so paginating callers can construct the
+        loop-invariant base dict once per run instead of once per page.
+        """
+        params = {
+            'limit': min(limit, 100),  # HubSpot API limit
+            'archived': str(archived).lower(),
+            'properties': ','.join(properties) if properties else self._DEFAULT_PROPERTIES_CSV
+        }
+
+        # Add additional filters
+        for key, value in filters.items():
+            if value is not None:
+                params[key] = value
+
+        return params
+
+    def _get_deals_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of deals for pre-built query parameters"""
+        start_ns = time.perf_counter_ns()
+
         try:
             self.logger.info(
                 "Retrieving deals from HubSpot",
                 extra={
                     'operation': 'get_deals',
-                    'limit': limit,
-                    'has_cursor': after is not None,
-                    'archived': archived,
-                    'properties_count': len(properties) if properties else 0
+                    'limit': params.get('limit'),
+                    'has_cursor': 'after' in params,
+                    'archived': params.get('archived'),
+                    'properties_count': params['properties'].count(',') + 1
                 }
             )
+
+            response = self._make_request('GET', self._deals_url, params=params)
             
-            # Build parameters
-            params = {
-                'limit': min(limit, 100),  # HubSpot API limit
-                'archived': str(archived).lower()
-            }
-            
-            if after:
-                params['after'] = after
-            
-            # Add properties
-            if properties:
-                params['properties'] = ','.join(properties)
-            else:
-                # Default properties for deals
-                default_properties = [
-                    'dealname', 'amount', 'dealstage', 'closedate', 'pipeline',
-                    'dealtype', 'hubspot_owner_id', 'description', 'createdate',
-                    'hs_lastmodifieddate', 'hs_deal_stage_probability'
-                ]
-                params['properties'] = ','.join(default_properties)
-            
-            # Add additional filters
-            for key, value in filters.items():
-                if value is not None:
-                    params[key] = value
-            
-            url = f"{self.base_url}/crm/v3/objects/deals"
-            response = self._make_request('GET', url, params=params)
-            
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            result = response.json()
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            result = self._json(response)
             
             deals_count = len(result.get('results', []))
             has_more = 'paging' in result and 'next' in result['paging']
@@ -251,7 +480,7 @@ class HubSpotAPIService:
             return result
             
         except requests.exceptions.RequestException as e:
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             self.logger.error(
                 "Error fetching deals from HubSpot",
@@ -274,6 +503,126 @@ class HubSpotAPIService:
             
             raise
     
+    def search_deals(self,
+                     limit: int = 200,
+                     after: Optional[str] = None,
+                     properties: Optional[List[str]] = None,
+                     deal_stages: Optional[List[str]] = None,
+                     pipelines: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Search deals via the HubSpot CRM v3 search API with server-side filters
+
+        Unlike the list endpoint, search allows up to 200 results per page and
+        pushes dealstage/pipeline filtering down to HubSpot, so filtered
+        extractions fetch half the pages and no discarded records.
+
+        Args:
+            limit: Number of deals per page (max 200)
+            after: Pagination cursor
+            properties: List of properties to include
+            deal_stages: Deal stage values to match (IN filter)
+            pipelines: Pipeline values to match (IN filter)
+
+        Returns:
+            Dict containing deals data and pagination info
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            search_filters = []
+            if deal_stages:
+                search_filters.append({
+                    'propertyName': 'dealstage',
+                    'operator': 'IN',
+                    'values': sorted(deal_stages)
+                })
+            if pipelines:
+                search_filters.append({
+                    'propertyName': 'pipeline',
+                    'operator': 'IN',
+                    'values': sorted(pipelines)
+                })
+
+            self.logger.info(
+                "Searching deals in HubSpot",
+                extra={
+                    'operation': 'search_deals',
+                    'limit': limit,
+                    'has_cursor': after is not None,
+                    'filters_count': len(search_filters),
+                    'properties_count': len(properties) if properties else 0
+                }
+            )
+
+            body = {
+                'limit': min(limit, 200),  # HubSpot search API limit
+                'filterGroups': [{'filters': search_filters}] if search_filters else []
+            }
+
+            if after:
+                body['after'] = after
+
+            if properties:
+                body['properties'] = list(properties)
+
+            # Pace against the search endpoint's own lower limit on top of
+            # the account-wide one enforced inside _make_request
+            self._search_limiter.acquire()
+
+            url = self._deals_search_url
+            response = self._make_request('POST', url, json=body)
+
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            result = self._json(response)
+
+            deals_count = len(result.get('results', []))
+            has_more = 'paging' in result and 'next' in result['paging']
+
+            self.logger.info(
+                "Deals search completed successfully",
+                extra={
+                    'operation': 'search_deals',
+                    'status_code': response.status_code,
+                    'duration_ms': round(duration_ms, 2),
+                    'deals_count': deals_count,
+                    'has_more': has_more
+                }
+            )
+
+            log_api_call(
+                self.logger,
+                "hubspot_search_deals",
+                method='POST',
+                status_code=response.status_code,
+                duration_ms=round(duration_ms, 2)
+            )
+
+            return result
+
+        except requests.exceptions.RequestException as e:
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+            self.logger.error(
+                "Error searching deals in HubSpot",
+                extra={
+                    'operation': 'search_deals',
+                    'error': str(e),
+                    'duration_ms': round(duration_ms, 2),
+                    'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
+                },
+                exc_info=True
+            )
+
+            log_api_call(
+                self.logger,
+                "hubspot_search_deals",
+                method='POST',
+                status_code=getattr(e.response, 'status_code', None) if hasattr(e, 'response') else 500,
+                duration_ms=round(duration_ms, 2)
+            )
+
+            raise
+
     def get_deal_by_id(self, deal_id: str, properties: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get a specific deal by ID
@@ -286,10 +635,11 @@ class HubSpotAPIService:
             Dict containing deal data
         """
         try:
-            self.logger.debug(
-                "Retrieving deal by ID",
-                extra={'operation': 'get_deal_by_id', 'deal_id': deal_id}
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Retrieving deal by ID",
+                    extra={'operation': 'get_deal_by_id', 'deal_id': deal_id}
+                )
             
             params = {}
             if properties:
@@ -298,16 +648,17 @@ class HubSpotAPIService:
             url = f"{self.base_url}/crm/v3/objects/deals/{deal_id}"
             response = self._make_request('GET', url, params=params)
             
-            result = response.json()
+            result = self._json(response)
             
-            self.logger.debug(
-                "Deal retrieved by ID",
-                extra={
-                    'operation': 'get_deal_by_id',
-                    'deal_id': deal_id,
-                    'deal_name': result.get('properties', {}).get('dealname')
-                }
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Deal retrieved by ID",
+                    extra={
+                        'operation': 'get_deal_by_id',
+                        'deal_id': deal_id,
+                        'deal_name': result.get('properties', {}).get('dealname')
+                    }
+                )
             
             return result
             
@@ -319,6 +670,75 @@ class HubSpotAPIService:
             )
             raise
     
+    def get_deals_by_ids(self,
+                         deal_ids: List[str],
+                         properties: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get multiple deals by ID via the batch read endpoint
+
+        Collapses N single-deal round-trips into ceil(N/100) POSTs against
+        /crm/v3/objects/deals/batch/read, which accepts up to 100 IDs per
+        call. Callers that need many deals should prefer this over looping
+        get_deal_by_id.
+
+        Args:
+            deal_ids: HubSpot deal IDs to retrieve
+            properties: List of properties to include
+
+        Returns:
+            List of deal dictionaries, one per found ID
+        """
+        if not deal_ids:
+            return []
+
+        url = f"{self.base_url}/crm/v3/objects/deals/batch/read"
+        props = list(properties) if properties else list(self._DEFAULT_PROPERTIES)
+        deals: List[Dict[str, Any]] = []
+
+        try:
+            self.logger.info(
+                "Retrieving deals by ID batch",
+                extra={
+                    'operation': 'get_deals_by_ids',
+                    'ids_count': len(deal_ids),
+                    'batch_count': (len(deal_ids) + 99) // 100
+                }
+            )
+
+            for start in range(0, len(deal_ids), 100):
+                chunk = deal_ids[start:start + 100]
+                body = {
+                    'inputs': [{'id': deal_id} for deal_id in chunk],
+                    'properties': props
+                }
+
+                response = self._make_request('POST', url, json=body)
+                result = self._json(response)
+                deals.extend(result.get('results', []))
+
+            self.logger.info(
+                "Deals batch retrieval completed",
+                extra={
+                    'operation': 'get_deals_by_ids',
+                    'ids_count': len(deal_ids),
+                    'deals_count': len(deals)
+                }
+            )
+
+            return deals
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(
+                "Error fetching deals by ID batch",
+                extra={
+                    'operation': 'get_deals_by_ids',
+                    'ids_count': len(deal_ids),
+                    'error': str(e)
+                },
+                exc_info=True
+            )
+            raise
+
     def get_deal_properties(self) -> List[Dict[str, Any]]:
         """
         Get all available deal properties from HubSpot
@@ -333,9 +753,7 @@ class HubSpotAPIService:
             )
             
             url = f"{self.base_url}/crm/v3/properties/deals"
-            response = self._make_request('GET', url)
-            
-            result = response.json()
+            result = self._cached_get(url)
             properties = result.get('results', [])
             
             self.logger.info(
@@ -370,9 +788,7 @@ class HubSpotAPIService:
             )
             
             url = f"{self.base_url}/crm/v3/pipelines/deals"
-            response = self._make_request('GET', url)
-            
-            result = response.json()
+            result = self._cached_get(url)
             pipelines = result.get('results', [])
             
             self.logger.info(
@@ -399,19 +815,23 @@ class HubSpotAPIService:
                       **filters) -> Generator[Dict[str, Any], None, None]:
         """
         Generator that yields all deals with automatic pagination
-        
+
+        The next page request is issued on a background worker as soon as the
+        current page's cursor is known, so the HTTP round-trip for page N+1
+        overlaps with consumer processing of page N instead of adding dead
+        time between pages.
+
         Args:
             properties: List of properties to include
             archived: Include archived deals
             **filters: Additional filters
-        
+
         Yields:
             Individual deal dictionaries
         """
-        after = None
         page_count = 0
         total_deals = 0
-        
+
         self.logger.info(
             "Starting paginated deals extraction",
             extra={
@@ -420,65 +840,336 @@ class HubSpotAPIService:
                 'properties_count': len(properties) if properties else 0
             }
         )
-        
-        while True:
+
+        # Loop-invariant query params are built once; each page only adds
+        # its cursor on top
+        base_params = self._build_deals_params(100, properties, archived, **filters)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._get_deals_page, base_params)
+
+        try:
+            while True:
+                try:
+                    page_count += 1
+                    response = future.result()
+                    future = None
+
+                    deals = response.get('results', [])
+                    if not deals:
+                        break
+
+                    # Kick off the next fetch before yielding this page
+                    paging = response.get('paging', {})
+                    after = paging['next']['after'] if 'next' in paging else None
+
+                    # Predict termination instead of probing for it: a short
+                    # page means the cursor chain is exhausted even when a
+                    # paging.next link is present (total a multiple of the
+                    # page size, or filters pruned the tail), and a response
+                    # total tells us outright when everything has been seen.
+                    # Either way, skip the final empty-page round-trip
+                    total = response.get('total')
+                    if len(deals) < 100:
+                        after = None
+                    elif total is not None and total_deals + len(deals) >= total:
+                        after = None
+
+                    if after:
+                        future = executor.submit(
+                            self._get_deals_page, {**base_params, 'after': after}
+                        )
+
+                    for deal in deals:
+                        total_deals += 1
+                        yield deal
+
+                    if not after:
+                        break
+
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            f"Completed page {page_count}",
+                            extra={
+                                'operation': 'get_all_deals',
+                                'page': page_count,
+                                'deals_in_page': len(deals),
+                                'total_deals': total_deals,
+                                'has_next': True
+                            }
+                        )
+
+                except Exception as e:
+                    self.logger.error(
+                        f"Error on page {page_count}",
+                        extra={
+                            'operation': 'get_all_deals',
+                            'page': page_count,
+                            'error': str(e)
+                        },
+                        exc_info=True
+                    )
+                    raise
+        finally:
+            # Covers normal exhaustion, errors and abandoned generators
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        self.logger.info(
+            "Completed paginated deals extraction",
+            extra={
+                'operation': 'get_all_deals',
+                'total_pages': page_count,
+                'total_deals': total_deals
+            }
+        )
+    
+    def get_all_deals_multi(self,
+                            pipelines: List[str],
+                            properties: Optional[List[str]] = None,
+                            archived: bool = False,
+                            **filters) -> Generator[Dict[str, Any], None, None]:
+        """
+        Generator that yields deals from several pipelines concurrently
+
+        Each pipeline's paginated stream has an independent cursor, so one
+        worker thread drives each stream and the yields are merged through
+        a bounded queue for backpressure. Wall time approaches the slowest
+        pipeline instead of the sum of all of them. The workers share this
+        service's rate limiter, so combined throughput still respects
+        HubSpot's account-wide 150/10s cap.
+
+        Pipeline filtering goes through the search endpoint — the v3 list
+        endpoint ignores a pipeline query parameter — except for archived
+        scans, which search cannot serve: those run one list-endpoint
+        stream with a client-side pipeline filter instead of N redundant
+        full scans.
+
+        Args:
+            pipelines: Pipeline IDs to extract, one stream per pipeline
+            properties: List of properties to include
+            archived: Include archived deals
+            **filters: Additional filters for the archived list-endpoint
+                fallback; the search path only pushes the pipeline filter
+
+        Yields:
+            Individual deal dictionaries, interleaved across pipelines
+        """
+        if not pipelines:
+            return
+        if archived:
+            # Search never returns archived objects; stream the archived
+            # set once and filter client-side rather than per-pipeline
+            wanted = frozenset(pipelines)
+            for deal in self.get_all_deals(
+                properties=properties, archived=True, **filters
+            ):
+                if (deal.get('properties') or {}).get('pipeline') in wanted:
+                    yield deal
+            return
+        if len(pipelines) == 1:
+            yield from self._search_pipeline_deals(pipelines[0], properties)
+            return
+
+        merged: queue.Queue = queue.Queue(maxsize=1000)
+        done = object()  # per-worker completion marker
+        stop = threading.Event()
+
+        def drain(pipeline_id: str):
+            item = done
             try:
-                page_count += 1
-                response = self.get_deals(
-                    limit=100,
-                    after=after,
-                    properties=properties,
-                    archived=archived,
-                    **filters
-                )
-                
-                deals = response.get('results', [])
-                if not deals:
-                    break
-                
-                for deal in deals:
+                for deal in self._search_pipeline_deals(pipeline_id, properties):
+                    if stop.is_set():
+                        return
+                    self._put_until_stopped(merged, deal, stop)
+            except Exception as e:
+                item = e
+            finally:
+                self._put_until_stopped(merged, item, stop)
+
+        self.logger.info(
+            "Starting multi-pipeline deals extraction",
+            extra={
+                'operation': 'get_all_deals_multi',
+                'pipelines_count': len(pipelines)
+            }
+        )
+
+        workers = [
+            threading.Thread(target=drain, args=(pipeline_id,), daemon=True)
+            for pipeline_id in pipelines
+        ]
+        for worker in workers:
+            worker.start()
+
+        total_deals = 0
+        finished = 0
+        try:
+            while finished < len(workers):
+                item = merged.get()
+                if item is done:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
                     total_deals += 1
-                    yield deal
-                
-                # Check for next page
-                paging = response.get('paging', {})
-                if 'next' not in paging:
-                    break
-                
-                after = paging['next']['after']
-                
+                    yield item
+        finally:
+            # Covers errors and abandoned generators: unblock any worker
+            # waiting on a full queue so its thread can exit
+            stop.set()
+
+        self.logger.info(
+            "Completed multi-pipeline deals extraction",
+            extra={
+                'operation': 'get_all_deals_multi',
+                'pipelines_count': len(pipelines),
+                'total_deals': total_deals
+            }
+        )
+
+    def _search_pipeline_deals(self,
+                               pipeline_id: str,
+                               properties: Optional[List[str]] = None
+                               ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yield every deal in one pipeline via search-endpoint pagination
+
+        The v3 list endpoint silently ignores a pipeline query parameter,
+        so pipeline filtering must go through /objects/deals/search, which
+        also allows 200-deal pages.
+        """
+        cursor = None
+        while True:
+            result = self.search_deals(
+                limit=200,
+                after=cursor,
+                properties=properties,
+                pipelines=[pipeline_id]
+            )
+            deals = result.get('results', [])
+            yield from deals
+
+            paging = result.get('paging', {})
+            cursor = paging['next']['after'] if 'next' in paging else None
+            if not cursor or len(deals) < 200:
+                break
+
+    @staticmethod
+    def _put_until_stopped(merged: queue.Queue, item, stop: threading.Event):
+        """Put onto a bounded queue, giving up if the consumer went away"""
+        while not stop.is_set():
+            try:
+                merged.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def get_all_deals_streaming(self,
+                                properties: Optional[List[str]] = None,
+                                archived: bool = False,
+                                **filters) -> Generator[Dict[str, Any], None, None]:
+        """
+        Generator that yields all deals, parsing each page incrementally
+
+        When ijson is installed, each page body is parsed straight off the
+        response stream and deals are yielded as they come off the wire, so
+        peak memory is one deal rather than one page and the consumer starts
+        before the page finishes downloading. Without ijson this falls back
+        to the buffered get_all_deals generator.
+
+        Args:
+            properties: List of properties to include
+            archived: Include archived deals
+            **filters: Additional filters
+
+        Yields:
+            Individual deal dictionaries
+        """
+        if ijson is None:
+            yield from self.get_all_deals(
+                properties=properties, archived=archived, **filters
+            )
+            return
+
+        params = {
+            'limit': 100,
+            'archived': str(archived).lower(),
+            'properties': ','.join(properties) if properties else self._DEFAULT_PROPERTIES_CSV
+        }
+        for key, value in filters.items():
+            if value is not None:
+                params[key] = value
+
+        page_count = 0
+        total_deals = 0
+        after = None
+
+        self.logger.info(
+            "Starting streaming deals extraction",
+            extra={
+                'operation': 'get_all_deals_streaming',
+                'archived': archived,
+                'properties_count': len(properties) if properties else 0
+            }
+        )
+
+        while True:
+            page_params = {**params, 'after': after} if after else params
+            response = self._make_request(
+                'GET', self._deals_url, params=page_params, stream=True
+            )
+
+            page_count += 1
+            deals_in_page = 0
+            after = None
+            builder = None
+
+            try:
+                # Let urllib3 undo any content-encoding before ijson sees
+                # the bytes
+                response.raw.decode_content = True
+
+                for prefix, event, value in ijson.parse(response.raw):
+                    if prefix == 'results.item' and event == 'start_map':
+                        builder = ijson.ObjectBuilder()
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == 'results.item' and event == 'end_map':
+                            deals_in_page += 1
+                            total_deals += 1
+                            yield builder.value
+                            builder = None
+                    elif prefix == 'paging.next.after':
+                        after = value
+            finally:
+                response.close()
+
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
-                    f"Completed page {page_count}",
+                    f"Streamed page {page_count}",
                     extra={
-                        'operation': 'get_all_deals',
+                        'operation': 'get_all_deals_streaming',
                         'page': page_count,
-                        'deals_in_page': len(deals),
+                        'deals_in_page': deals_in_page,
                         'total_deals': total_deals,
-                        'has_next': True
+                        'has_next': after is not None
                     }
                 )
-                
-            except Exception as e:
-                self.logger.error(
-                    f"Error on page {page_count}",
-                    extra={
-                        'operation': 'get_all_deals',
-                        'page': page_count,
-                        'error': str(e)
-                    },
-                    exc_info=True
-                )
-                raise
-        
+
+            if not after or deals_in_page == 0:
+                break
+
         self.logger.info(
-            "Completed paginated deals extraction",
+            "Completed streaming deals extraction",
             extra={
-                'operation': 'get_all_deals',
+                'operation': 'get_all_deals_streaming',
                 'total_pages': page_count,
                 'total_deals': total_deals
             }
         )
-    
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test connection to HubSpot API and return comprehensive status
@@ -507,45 +1198,53 @@ class HubSpotAPIService:
             results['api_reachable'] = results['credentials_valid']
             
             if results['credentials_valid']:
-                # Test deals access
-                try:
-                    test_deals = self.get_deals(limit=1)
-                    results['deals_accessible'] = True
-                    
-                    # Extract rate limit info from headers if available
-                    # Note: HubSpot doesn't always provide rate limit headers
-                    results['rate_limit_info'] = {
-                        'limit': self.rate_limit,
-                        'period_seconds': self.rate_period,
-                        'requests_per_second': round(self.rate_limit / self.rate_period, 2)
-                    }
-                    
-                except Exception as e:
-                    self.logger.warning(
-                        "Deals access test failed",
-                        extra={'operation': 'test_connection', 'error': str(e)}
-                    )
-                
-                # Test properties access (optional)
-                try:
-                    properties = self.get_deal_properties()
-                    results['properties_accessible'] = len(properties) > 0
-                except Exception as e:
-                    self.logger.debug(
-                        "Properties access test failed (optional)",
-                        extra={'operation': 'test_connection', 'error': str(e)}
-                    )
-                
-                # Test pipelines access (optional)
-                try:
-                    pipelines = self.get_pipelines()
-                    results['pipelines_accessible'] = len(pipelines) > 0
-                except Exception as e:
-                    self.logger.debug(
-                        "Pipelines access test failed (optional)",
-                        extra={'operation': 'test_connection', 'error': str(e)}
-                    )
-                
+                # The deals/properties/pipelines probes are independent
+                # round-trips with no data dependency once credentials pass,
+                # so issue them concurrently and collect the results
+                with ThreadPoolExecutor(max_workers=3) as probe_pool:
+                    deals_future = probe_pool.submit(self.get_deals, limit=1)
+                    properties_future = probe_pool.submit(self.get_deal_properties)
+                    pipelines_future = probe_pool.submit(self.get_pipelines)
+
+                    # Test deals access
+                    try:
+                        deals_future.result()
+                        results['deals_accessible'] = True
+
+                        # Extract rate limit info from headers if available
+                        # Note: HubSpot doesn't always provide rate limit headers
+                        results['rate_limit_info'] = {
+                            'limit': self.rate_limit,
+                            'period_seconds': self.rate_period,
+                            'requests_per_second': round(self.rate_limit / self.rate_period, 2)
+                        }
+
+                    except Exception as e:
+                        self.logger.warning(
+                            "Deals access test failed",
+                            extra={'operation': 'test_connection', 'error': str(e)}
+                        )
+
+                    # Test properties access (optional)
+                    try:
+                        properties = properties_future.result()
+                        results['properties_accessible'] = len(properties) > 0
+                    except Exception as e:
+                        self.logger.debug(
+                            "Properties access test failed (optional)",
+                            extra={'operation': 'test_connection', 'error': str(e)}
+                        )
+
+                    # Test pipelines access (optional)
+                    try:
+                        pipelines = pipelines_future.result()
+                        results['pipelines_accessible'] = len(pipelines) > 0
+                    except Exception as e:
+                        self.logger.debug(
+                            "Pipelines access test failed (optional)",
+                            extra={'operation': 'test_connection', 'error': str(e)}
+                        )
+
                 self.logger.info(
                     "HubSpot connection test completed",
                     extra={